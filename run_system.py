@@ -4,6 +4,7 @@ import sys
 import os
 import time
 import signal
+from multiprocessing import Queue
 
 # Добавляем пути для импорта
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,7 +21,7 @@ from src.satellite_control_system.restricted_zone import RestrictedZone
 from src.client.auth import authorize, AuthError
 from src.client.command_processor import CommandInterpreter, UserContext, parse_program
 from src.client.logger import setup_logger
-from src.system.config import DEFAULT_LOG_LEVEL
+from src.system.config import DEFAULT_LOG_LEVEL, CLIENT_QUEUE_NAME
 from src.system.event_types import Event
 
 
@@ -67,6 +68,10 @@ class SatelliteControlSystem:
         # Создаем каталог очередей
         self.queues_dir = QueuesDirectory()
 
+        # Очередь подтверждений для клиента: регистрируем до запуска
+        # компонентов, чтобы монитор безопасности мог слать подтверждения
+        self.queues_dir.register(queue=Queue(), name=CLIENT_QUEUE_NAME)
+
         # 1. Монитор безопасности
         security_monitor = SecurityMonitor(
             queues_dir=self.queues_dir,
@@ -242,10 +247,6 @@ class SatelliteControlSystem:
 
     def execute_program(self, commands):
         """Выполнение программы управления"""
-        if not commands:
-            self.log.warning("Нет команд для выполнения")
-            return
-
         self.log.info("=" * 60)
         self.log.info("ВЫПОЛНЕНИЕ ПРОГРАММЫ")
         self.log.info("=" * 60)
@@ -285,12 +286,12 @@ class SatelliteControlSystem:
                 self.log.warning(f"Файл программы '{program_file}' не найден")
                 program_file = input("Введите путь к файлу программы: ").strip()
 
+            # parse_program возвращает генератор: команды выполняются
+            # по мере разбора файла
             commands = parse_program(program_file)
-            self.log.info(f"Загружена программа: {len(commands)} команд")
 
-            if commands:
-                # 5. Выполняем программу
-                self.execute_program(commands)
+            # 5. Выполняем программу
+            self.execute_program(commands)
 
             while self.running:
                 time.sleep(0.1)
@@ -1,8 +1,12 @@
 """Обработчик команд, парсер программ, система прав доступа"""
 
+import math
 import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from queue import Empty
+from typing import Iterable, Iterator, NamedTuple, Tuple
+
+from src.system.config import ACK_TIMEOUT_SEC, CLIENT_QUEUE_NAME
 
 # === КОНСТАНТЫ РОЛЕЙ ===
 ROLE_CLIENT = 1
@@ -17,12 +21,18 @@ PERMISSIONS = {
     "REMOVE ZONE": {ROLE_ADMIN},
 }
 
+# Предвычисленная таблица: роль -> множество разрешенных команд
+_EMPTY_PERMISSIONS = frozenset()
+ROLE_ALLOWED = {
+    role: frozenset(cmd for cmd, roles in PERMISSIONS.items() if role in roles)
+    for role in (ROLE_CLIENT, ROLE_VIP, ROLE_ADMIN)
+}
+
 
 # === СТРУКТУРЫ ДАННЫХ ===
-@dataclass
-class Command:
+class Command(NamedTuple):
     name: str
-    args: Tuple
+    args: Tuple = ()
 
 
 @dataclass
@@ -36,10 +46,21 @@ class Interpreter:
 
 
 # === ПАРСЕР ПРОГРАММ ===
-def parse_program(program_file: str) -> List[Command]:
-    """Чтение и разбор программы из файла"""
-    commands = []
+# Таблица разбора: первое слово строки -> (имя команды, слова имени,
+# конвертеры аргументов); команда находится одним поиском в словаре
+_PARSE_TABLE = {
+    "ORBIT": ("ORBIT", ["ORBIT"], (float, float, float)),
+    "MAKE": ("MAKE PHOTO", ["MAKE", "PHOTO"], ()),
+    "ADD": ("ADD ZONE", ["ADD", "ZONE"], (int, float, float, float, float)),
+    "REMOVE": ("REMOVE ZONE", ["REMOVE", "ZONE"], (int,)),
+}
+
 
+def parse_program(program_file: str) -> Iterator[Command]:
+    """Чтение и разбор программы из файла.
+
+    Команды выдаются по мере разбора, поэтому выполнение может начаться,
+    не дожидаясь чтения всего файла, и программа не копится в памяти"""
     try:
         with open(program_file, "r", encoding="utf-8") as f:
             for line_num, line in enumerate(f, 1):
@@ -49,47 +70,30 @@ def parse_program(program_file: str) -> List[Command]:
                 if not line or line.startswith("#"):
                     continue
 
-                # Разбираем команду
+                # Разбираем команду по таблице
                 parts = line.split()
-
-                if parts[0] == "ORBIT" and len(parts) == 4:
-                    commands.append(
-                        Command(name="ORBIT", args=tuple(map(float, parts[1:4])))
-                    )
-
-                elif line == "MAKE PHOTO":
-                    commands.append(Command(name="MAKE PHOTO", args=()))
-
-                elif parts[0] == "ADD" and parts[1] == "ZONE" and len(parts) == 7:
-                    commands.append(
-                        Command(
-                            name="ADD ZONE",
-                            args=(
-                                int(parts[2]),
-                                float(parts[3]),
-                                float(parts[4]),
-                                float(parts[5]),
-                                float(parts[6]),
-                            ),
+                entry = _PARSE_TABLE.get(parts[0])
+
+                if entry is not None:
+                    name, name_parts, converters = entry
+                    n = len(name_parts)
+                    if len(parts) == n + len(converters) and parts[:n] == name_parts:
+                        args = tuple(
+                            conv(tok) for conv, tok in zip(converters, parts[n:])
                         )
-                    )
-
-                elif parts[0] == "REMOVE" and parts[1] == "ZONE" and len(parts) == 3:
-                    commands.append(Command(name="REMOVE ZONE", args=(int(parts[2]),)))
+                        yield Command(name=name, args=args)
+                        continue
 
-                else:
-                    raise ValueError(f"Ошибка синтаксиса в строке {line_num}: {line}")
+                raise ValueError(f"Ошибка синтаксиса в строке {line_num}: {line}")
 
     except Exception as e:
         raise ValueError(f"Ошибка чтения файла {program_file}: {e}")
 
-    return commands
-
 
 # === ПРОВЕРКА ПРАВ ДОСТУПА ===
 def check_permission(role: int, command_name: str) -> bool:
     """Проверяет, имеет ли роль право выполнять команду"""
-    return role in PERMISSIONS.get(command_name, set())
+    return command_name in ROLE_ALLOWED.get(role, _EMPTY_PERMISSIONS)
 
 
 def get_role_name(role: int) -> str:
@@ -102,111 +106,152 @@ def get_role_name(role: int) -> str:
 class CommandInterpreter:
     """Интерпретатор и исполнитель команд"""
 
-    def __init__(self, user_context: UserContext, logger, queues_dir):
+    # Допустимые диапазоны параметров команды ORBIT: (нижняя, верхняя граница)
+    _ORBIT_BOUNDS = (
+        (160_000, 2_000_000),
+        (0, 2 * math.pi),
+        (-math.pi / 2, math.pi / 2),
+    )
+    _ORBIT_NAMES = ("Высота орбиты", "RAAN", "Наклонение")
+
+    def __init__(self, user_context: UserContext, logger, queues_dir,
+                 inter_command_delay: float = None):
         self.user = user_context
         self.log = logger
         self.queues_dir = queues_dir
         self.command_counter = 0
+        # Пауза между командами: None - встроенные паузы по типу команды,
+        # число - единая пауза в секундах (0 - без пауз)
+        self._inter_command_delay = inter_command_delay
+        # Разрешенные команды для роли пользователя (вычисляются один раз)
+        self._allowed_commands = ROLE_ALLOWED.get(user_context.role, _EMPTY_PERMISSIONS)
+        # Очередь подтверждений от монитора безопасности (если зарегистрирована)
+        self._ack_q = queues_dir.get_queue(CLIENT_QUEUE_NAME) if queues_dir else None
+        self._pending_acks = 0
+        # Буфер исходящих событий: серия команд уходит одним put()
+        self._outbox = []
+        # Очередь монитора безопасности ищется в каталоге один раз
+        self._security_q = None
+        # Префиксы подписей вычисляются один раз: в горячем цикле
+        # остается только конкатенация с номером команды
+        username = user_context.username
+        self._sig_prefixes = {
+            "ORBIT": f"orbit_{username}_",
+            "MAKE PHOTO": f"photo_{username}_",
+            "ADD ZONE": f"addzone_{username}_",
+            "REMOVE ZONE": f"removezone_{username}_",
+        }
+        # Таблица обработчиков команд: поиск за O(1) вместо цепочки сравнений
+        self._command_handlers = {
+            "ORBIT": self._execute_orbit_command,
+            "MAKE PHOTO": self._execute_photo_command,
+            "ADD ZONE": self._execute_add_zone_command,
+            "REMOVE ZONE": self._execute_remove_zone_command,
+        }
+
+    def execute_program(self, commands: Iterable[Command]):
+        """Выполняет последовательность команд (список или генератор)"""
+        self.log.info(
+            "Пользователь '%s' начинает выполнение программы", self.user.username
+        )
 
-    def execute_program(self, commands: List[Command]):
-        """Выполняет список команд"""
-        if not commands:
+        it = iter(commands)
+        cmd = next(it, None)
+        if cmd is None:
             self.log.warning("Нет команд для выполнения")
             return
 
-        self.log.info(
-            f"Пользователь '{self.user.username}' начинает выполнение программы ({len(commands)} команд)"
-        )
+        i = 0
+        while cmd is not None:
+            i += 1
+            # Читаем следующую команду заранее: серию подряд идущих съемок
+            # отправляем без пауз между снимками, события уходят пачкой,
+            # пауза выдерживается после всей серии
+            next_cmd = next(it, None)
+            is_batched = (cmd.name == "MAKE PHOTO"
+                          and next_cmd is not None and next_cmd.name == "MAKE PHOTO")
+            self._execute_single_command(cmd, i, pause=not is_batched)
+            cmd = next_cmd
 
-        for i, cmd in enumerate(commands, 1):
-            self._execute_single_command(cmd, i)
+        # На случай, если последняя команда завершилась ошибкой до отправки
+        self._flush_outbox()
 
-        self.log.info("Программа выполнена успешно")
+        self.log.info("Программа выполнена успешно (%d команд)", i)
 
-    def _execute_single_command(self, cmd: Command, sequence_num: int):
+    def _execute_single_command(self, cmd: Command, sequence_num: int, pause: bool = True):
         """Выполняет одну команду с проверкой прав и логированием"""
         # Импортируем здесь, чтобы избежать циклических зависимостей
         from src.system.event_types import Event
 
-        self.log.info(f"Команда #{sequence_num}: {cmd.name}")
+        self.log.info("Команда #%d: %s", sequence_num, cmd.name)
 
         # Проверка прав доступа
-        if not check_permission(self.user.role, cmd.name):
+        if cmd.name not in self._allowed_commands:
             self.log.warning(
-                f"ОТКАЗ: У пользователя '{self.user.username}' ({get_role_name(self.user.role)}) "
-                f"нет прав на выполнение команды '{cmd.name}'"
+                "ОТКАЗ: У пользователя '%s' (%s) нет прав на выполнение команды '%s'",
+                self.user.username, get_role_name(self.user.role), cmd.name
             )
             return
 
         try:
             # Выполнение команды
-            if cmd.name == "ORBIT":
-                self._execute_orbit_command(cmd.args)
-
-            elif cmd.name == "MAKE PHOTO":
-                self._execute_photo_command()
-
-            elif cmd.name == "ADD ZONE":
-                self._execute_add_zone_command(cmd.args)
-
-            elif cmd.name == "REMOVE ZONE":
-                self._execute_remove_zone_command(cmd.args)
-
-            else:
+            handler = self._command_handlers.get(cmd.name)
+            if handler is None:
                 raise ValueError(f"Неизвестная команда: {cmd.name}")
+            handler(cmd.args)
 
-            self.log.info(f"УСПЕХ: {cmd.name} {cmd.args}")
+            self.log.info("УСПЕХ: %s %s", cmd.name, cmd.args)
 
-            # Пауза между командами для стабильности
-            self._pause_after_command(cmd.name)
+            # Серия команд копится в буфере; отправляем ее одним сообщением
+            # и ждем подтверждения обработки вместо фиксированной паузы
+            if pause:
+                self._flush_outbox()
+                self._wait_for_completion(cmd.name)
 
         except Exception as e:
-            self.log.error(f"ОШИБКА выполнения команды {cmd.name}: {e}")
+            self.log.error("ОШИБКА выполнения команды %s: %s", cmd.name, e)
 
     def _execute_orbit_command(self, args):
         """Выполняет команду ORBIT"""
         altitude, raan, inclination = args
 
-        # Валидация параметров
-        if not (160000 <= altitude <= 2000000):
-            raise ValueError(f"Высота орбиты {altitude} вне диапазона 160000-2000000")
+        # Валидация параметров по таблице диапазонов
+        for value, (lo, hi), name in zip(args, self._ORBIT_BOUNDS, self._ORBIT_NAMES):
+            if not lo <= value <= hi:
+                raise ValueError(f"{name} {value} вне диапазона {lo}-{hi}")
 
         # Отправка команды в систему
-        q = self.queues_dir.get_queue('security')
-        if q:
-            from src.system.event_types import Event
-
-            q.put(
-                Event(
-                    source=f"client_{self.user.username}",
-                    destination="orbit_control",
-                    operation="change_orbit",
-                    parameters=(altitude, raan, inclination),
-                    signature=f"orbit_{self.user.username}_{self.command_counter}",
-                )
+        from src.system.event_types import Event
+
+        self._send_to_security(
+            Event(
+                source=f"client_{self.user.username}",
+                destination="orbit_control",
+                operation="change_orbit",
+                parameters=(altitude, raan, inclination),
+                extra_parameters=self._with_ack(),
+                signature=self._sig_prefixes["ORBIT"] + str(self.command_counter),
             )
-            self.command_counter += 1
-
-    def _execute_photo_command(self):
-        q = self.queues_dir.get_queue("security")
-        if q:
-            from src.system.event_types import Event
-
-            q.put(
-                Event(
-                    source=f"client_{self.user.username}",
-                    destination="optics_control",
-                    operation="request_photo",
-                    parameters=None,
-                    extra_parameters={
-                        "user": self.user.username,
-                        "role": self.user.role,
-                        "priority": 1,
-                    },
-                    signature=f"photo_{self.user.username}_{self.command_counter}",
-                )
+        )
+
+    def _execute_photo_command(self, args=()):
+        """Выполняет команду MAKE PHOTO (аргументы не используются)"""
+        from src.system.event_types import Event
+
+        self._send_to_security(
+            Event(
+                source=f"client_{self.user.username}",
+                destination="optics_control",
+                operation="request_photo",
+                parameters=None,
+                extra_parameters=self._with_ack({
+                    "user": self.user.username,
+                    "role": self.user.role,
+                    "priority": 1,
+                }),
+                signature=self._sig_prefixes["MAKE PHOTO"] + str(self.command_counter),
             )
-            self.command_counter += 1
+        )
 
     def _execute_add_zone_command(self, args):
         """Выполняет команду ADD ZONE"""
@@ -227,50 +272,105 @@ class CommandInterpreter:
         )
 
         # Отправка команды в систему
-        q = self.queues_dir.get_queue("security")
-        if q:
-            from src.system.event_types import Event
-
-            q.put(
-                Event(
-                    source=f"client_{self.user.username}",
-                    destination="security_monitor",
-                    operation="add_restricted_zone",
-                    parameters=zone,
-                    extra_parameters={
-                        "user": self.user.username,
-                        "role": self.user.role,
-                    },
-                    signature=f"addzone_{self.user.username}_{self.command_counter}",
-                )
+        from src.system.event_types import Event
+
+        self._send_to_security(
+            Event(
+                source=f"client_{self.user.username}",
+                destination="security_monitor",
+                operation="add_restricted_zone",
+                parameters=zone,
+                extra_parameters=self._with_ack({
+                    "user": self.user.username,
+                    "role": self.user.role,
+                }),
+                signature=self._sig_prefixes["ADD ZONE"] + str(self.command_counter),
             )
-            self.command_counter += 1
+        )
 
     def _execute_remove_zone_command(self, args):
         """Выполняет команду REMOVE ZONE"""
         zone_id = args[0]
 
-        q = self.queues_dir.get_queue("security")
-        if q:
-            from src.system.event_types import Event
-
-            q.put(
-                Event(
-                    source=f"client_{self.user.username}",
-                    destination="security_monitor",
-                    operation="remove_restricted_zone",
-                    parameters=zone_id,
-                    extra_parameters={
-                        "user": self.user.username,
-                        "role": self.user.role,
-                    },
-                    signature=f"removezone_{self.user.username}_{self.command_counter}",
-                )
+        from src.system.event_types import Event
+
+        self._send_to_security(
+            Event(
+                source=f"client_{self.user.username}",
+                destination="security_monitor",
+                operation="remove_restricted_zone",
+                parameters=zone_id,
+                extra_parameters=self._with_ack({
+                    "user": self.user.username,
+                    "role": self.user.role,
+                }),
+                signature=self._sig_prefixes["REMOVE ZONE"] + str(self.command_counter),
             )
-            self.command_counter += 1
+        )
+
+    def _with_ack(self, extra_parameters: dict = None) -> dict:
+        """Добавляет адрес очереди подтверждений в доп. параметры события"""
+        if self._ack_q is None:
+            return extra_parameters
+        extra_parameters = dict(extra_parameters) if extra_parameters else {}
+        extra_parameters["ack_to"] = CLIENT_QUEUE_NAME
+        return extra_parameters
+
+    def _send_to_security(self, event):
+        """Буферизует событие для отправки в монитор безопасности"""
+        self._outbox.append(event)
+        self.command_counter += 1
+
+    def _flush_outbox(self):
+        """Отправляет накопленные события одним вызовом put"""
+        if not self._outbox:
+            return
+
+        events = self._outbox
+        self._outbox = []
+
+        q = self._security_q
+        if q is None:
+            q = self._security_q = self.queues_dir.get_queue("security")
+        if q is None:
+            return
+
+        # Одиночное событие отправляем как есть, серию - пачкой
+        q.put(events[0] if len(events) == 1 else events)
+        for event in events:
+            if isinstance(event.extra_parameters, dict) and "ack_to" in event.extra_parameters:
+                self._pending_acks += 1
+
+    def _wait_for_completion(self, command_name: str):
+        """Ждет подтверждения отправленных команд от монитора безопасности.
+        Без очереди подтверждений откатывается на фиксированную паузу"""
+        if self._ack_q is None or self._pending_acks == 0:
+            self._pause_after_command(command_name)
+            return
+
+        deadline = time.time() + ACK_TIMEOUT_SEC
+        while self._pending_acks > 0:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                self.log.warning(
+                    "Нет подтверждения команды %s за %s сек",
+                    command_name, ACK_TIMEOUT_SEC
+                )
+                self._pending_acks = 0
+                return
+            try:
+                self._ack_q.get(timeout=remaining)
+                self._pending_acks -= 1
+            except Empty:
+                pass
 
     def _pause_after_command(self, command_name: str):
         """Пауза после выполнения команды"""
+        if self._inter_command_delay is not None:
+            if self._inter_command_delay > 0:
+                time.sleep(self._inter_command_delay)
+            return
+
         if command_name == "ADD ZONE":
             time.sleep(1.5)  # Пауза для отрисовки зоны
         elif command_name == "ORBIT":
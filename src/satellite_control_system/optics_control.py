@@ -1,3 +1,6 @@
+import heapq
+import time
+
 from multiprocessing import Queue
 from queue import Empty
 from time import sleep
@@ -9,7 +12,8 @@ from src.system.event_types import Event, ControlEvent
 from src.system.config import CRITICALITY_STR, LOG_DEBUG, \
     LOG_ERROR, LOG_INFO, DEFAULT_LOG_LEVEL, \
     OPTICS_CONTROL_QUEUE_NAME, ORBIT_DRAWER_QUEUE_NAME, \
-    SECURITY_MONITOR_QUEUE_NAME, CAMERA_QUEUE_NAME
+    SECURITY_MONITOR_QUEUE_NAME, CAMERA_QUEUE_NAME, \
+    CONTROL_POLL_INTERVAL_SEC
 
 
 class OpticsControl(BaseCustomProcess):
@@ -21,7 +25,8 @@ class OpticsControl(BaseCustomProcess):
     def __init__(
             self,
             queues_dir: QueuesDirectory,
-            log_level: int = DEFAULT_LOG_LEVEL
+            log_level: int = DEFAULT_LOG_LEVEL,
+            control_poll_interval: float = CONTROL_POLL_INTERVAL_SEC
     ):
         super().__init__(
             log_prefix=OpticsControl.log_prefix,
@@ -30,37 +35,44 @@ class OpticsControl(BaseCustomProcess):
             event_source_name=OpticsControl.event_source_name,
             log_level=log_level)
 
-        self._photo_queue = []  # Очередь запросов на съемку
+        self._photo_queue = []  # Мин-куча запросов на съемку: (-приоритет, номер, запрос)
+        self._photo_seq = 0  # Счетчик для сохранения порядка запросов с равным приоритетом
         self._photo_interval = 2.0  # Интервал между съемками (сек)
         self._last_photo_time = 0.0
+        # Срок следующей съемки: пересчитывается только когда меняется
+        # (съемка выполнена или изменен интервал), а не на каждой итерации
+        self._next_photo_due = 0.0
         self._is_busy = False  # Флаг занятости камеры
+        self._control_poll_interval = control_poll_interval  # Максимальное время ожидания событий (сек)
 
         self._log_message(LOG_INFO, f"модуль управления оптикой создан")
 
+    def _handle_event(self, event: Event):
+        """ Обработка одного входящего события """
+        # Проверяем, что сообщение принадлежит типу Event (см. файл event_types.py)
+        if not isinstance(event, Event):
+            return
+
+        # Проверяем вид операции и обрабатываем
+        match event.operation:
+            case 'request_photo':
+                self._handle_photo_request(event)
+            case 'post_photo':
+                self._handle_post_photo(event)
+            case 'set_photo_interval':
+                self._handle_set_interval(event)
+            case 'get_status':
+                self._handle_get_status(event)
+            case _:
+                self._log_message(LOG_DEBUG, f"неизвестная операция: {event.operation}")
+
     def _check_events_q(self):
         """ Метод проверяет наличие сообщений для данного компонента системы """
         while True:
             try:
                 # Получаем сообщение из очереди
                 event: Event = self._events_q.get_nowait()
-
-                # Проверяем, что сообщение принадлежит типу Event (см. файл event_types.py)
-                if not isinstance(event, Event):
-                    continue
-
-                # Проверяем вид операции и обрабатываем
-                match event.operation:
-                    case 'request_photo':
-                        self._handle_photo_request(event)
-                    case 'post_photo':
-                        self._handle_post_photo(event)
-                    case 'set_photo_interval':
-                        self._handle_set_interval(event)
-                    case 'get_status':
-                        self._handle_get_status(event)
-                    case _:
-                        self._log_message(LOG_DEBUG, f"неизвестная операция: {event.operation}")
-
+                self._handle_event(event)
             except Empty:
                 break
 
@@ -88,26 +100,39 @@ class OpticsControl(BaseCustomProcess):
         except Empty:
             pass
 
+    def _wait_timeout(self) -> float:
+        """ Время ожидания до следующего полезного пробуждения:
+            до срока очередной съемки, но не дольше интервала проверки
+            управляющих команд """
+        timeout = self._control_poll_interval
+        if not self._is_busy and self._photo_queue:
+            timeout = min(timeout, max(self._next_photo_due - time.time(), 0.0))
+        return timeout
+
     def run(self):
         self._log_message(LOG_INFO, f"модуль управления оптикой активен")
 
-        import time
         self._last_photo_time = time.time()
+        self._next_photo_due = self._last_photo_time + self._photo_interval
 
         while self._quit is False:
             try:
-                # Проверяем входящие сообщения
+                # Ждем входящее событие ровно до срока следующей съемки,
+                # вместо фиксированной паузы на каждой итерации
+                try:
+                    event: Event = self._events_q.get(timeout=self._wait_timeout())
+                    self._handle_event(event)
+                except Empty:
+                    pass
+
+                # Дочитываем накопившиеся сообщения и управляющие команды
                 self._check_events_q()
                 self._check_control_q()
 
                 # Обрабатываем очередь съемок, если не заняты
-                if not self._is_busy and self._photo_queue:
-                    current_time = time.time()
-                    if current_time - self._last_photo_time >= self._photo_interval:
-                        self._process_next_photo_request()
-
-                # Небольшая пауза, чтобы не нагружать процессор
-                sleep(0.1)
+                if not self._is_busy and self._photo_queue \
+                        and time.time() >= self._next_photo_due:
+                    self._process_next_photo_request()
 
             except Exception as e:
                 self._log_message(LOG_ERROR, f"ошибка системы контроля оптики: {e}")
@@ -122,15 +147,17 @@ class OpticsControl(BaseCustomProcess):
         if event.extra_parameters and 'priority' in event.extra_parameters:
             priority = event.extra_parameters['priority']
 
-        self._photo_queue.append({
+        request = {
             'source': event.source,
             'timestamp': event.parameters if event.parameters else None,
             'priority': priority,
             'signature': event.signature
-        })
+        }
 
-        # Сортируем по приоритету (высокий приоритет первый)
-        self._photo_queue.sort(key=lambda x: x['priority'], reverse=True)
+        # Вставка в кучу за O(log N) вместо пересортировки всей очереди;
+        # высокий приоритет оказывается в вершине кучи
+        heapq.heappush(self._photo_queue, (-priority, self._photo_seq, request))
+        self._photo_seq += 1
 
         self._log_message(LOG_DEBUG, f"запрос добавлен в очередь. Размер очереди: {len(self._photo_queue)}")
 
@@ -139,18 +166,15 @@ class OpticsControl(BaseCustomProcess):
         if event.parameters:
             lat, lon = event.parameters
 
+            # Переиспользуем входящее событие вместо создания нового:
+            # параметры и подпись уже на месте, меняются только адресные поля
+            event.source = self._event_source_name
+            event.destination = ORBIT_DRAWER_QUEUE_NAME  # Важно: destination = ORBIT_DRAWER_QUEUE_NAME
+            event.operation = 'update_photo_map'
+
             # Отправляем через монитор безопасности для проверки
             q: Queue = self._queues_dir.get_queue(SECURITY_MONITOR_QUEUE_NAME)
-            q.put(
-                Event(
-                    source=self._event_source_name,
-                    destination=ORBIT_DRAWER_QUEUE_NAME,  # Важно: destination = ORBIT_DRAWER_QUEUE_NAME
-                    operation='update_photo_map',
-                    parameters=(lat, lon),
-                    extra_parameters=event.extra_parameters,
-                    signature=event.signature
-                )
-            )
+            q.put(event)
             self._log_message(LOG_DEBUG, f"отправлен снимок для отображения ({lat}, {lon})")
 
     def _handle_set_interval(self, event: Event):
@@ -160,6 +184,7 @@ class OpticsControl(BaseCustomProcess):
             if 0.5 <= new_interval <= 30.0:  # Разумные пределы
                 old_interval = self._photo_interval
                 self._photo_interval = new_interval
+                self._next_photo_due = self._last_photo_time + new_interval
                 self._log_message(LOG_INFO,
                                   f"интервал съемки изменен: {old_interval:.1f} -> {new_interval:.1f} сек")
             else:
@@ -197,10 +222,10 @@ class OpticsControl(BaseCustomProcess):
             return
 
         # Берем запрос с наивысшим приоритетом
-        request = self._photo_queue.pop(0)
+        _, _, request = heapq.heappop(self._photo_queue)
 
-        import time
         self._last_photo_time = time.time()
+        self._next_photo_due = self._last_photo_time + self._photo_interval
 
         self._log_message(LOG_INFO,
                           f"обрабатываю запрос на съемку от {request['source']} (приоритет: {request['priority']})")
@@ -6,7 +6,8 @@ from src.system.queues_dir import QueuesDirectory
 from src.system.event_types import Event, ControlEvent
 from src.system.config import CRITICALITY_STR, LOG_DEBUG, \
     LOG_ERROR, LOG_INFO, DEFAULT_LOG_LEVEL, \
-    ORBIT_CONTROL_QUEUE_NAME, SATELITE_QUEUE_NAME, SECURITY_MONITOR_QUEUE_NAME
+    ORBIT_CONTROL_QUEUE_NAME, SATELITE_QUEUE_NAME, SECURITY_MONITOR_QUEUE_NAME, \
+    CONTROL_POLL_INTERVAL_SEC
 
 
 class OrbitControl(BaseCustomProcess):
@@ -18,7 +19,8 @@ class OrbitControl(BaseCustomProcess):
     def __init__(
             self,
             queues_dir: QueuesDirectory,
-            log_level: int = DEFAULT_LOG_LEVEL
+            log_level: int = DEFAULT_LOG_LEVEL,
+            control_poll_interval: float = CONTROL_POLL_INTERVAL_SEC
     ):
         super().__init__(
             log_prefix=OrbitControl.log_prefix,
@@ -27,6 +29,16 @@ class OrbitControl(BaseCustomProcess):
             event_source_name=OrbitControl.event_source_name,
             log_level=log_level)
 
+        self._control_poll_interval = control_poll_interval  # Максимальное время ожидания событий (сек)
+
+        # Таблица обработчиков операций: поиск за O(1) вместо цепочки сравнений
+        self._handlers = {
+            'change_orbit': self._handle_change_orbit,
+        }
+
+        # Очередь монитора безопасности ищется в каталоге один раз
+        self._security_monitor_q = None
+
         self._log_message(LOG_INFO, "модуль контроля орбиты создан")
 
     def _check_control_q(self):
@@ -41,23 +53,30 @@ class OrbitControl(BaseCustomProcess):
         except Empty:
             pass
 
+    def _handle_event(self, event: Event):
+        """ Обработка одного входящего события """
+        if not isinstance(event, Event):
+            return
+
+        handler = self._handlers.get(event.operation)
+        if handler is None:
+            self._log_message(LOG_DEBUG, f"неизвестная операция: {event.operation}")
+            return
+        handler(event)
+
+    def _handle_change_orbit(self, event: Event):
+        """ Обработка запроса на смену параметров орбиты """
+        altitude, raan, inclination = event.parameters
+        self._log_message(LOG_INFO,
+                          f"получены новые параметры орбиты: altitude={altitude}, raan={raan}, inclination={inclination}")
+        self._change_orbit(altitude, raan, inclination)
+
     def _check_events_q(self):
         """ Метод проверяет наличие сообщений для данного компонента системы """
         while True:
             try:
                 event: Event = self._events_q.get_nowait()
-
-                if not isinstance(event, Event):
-                    return
-
-                match event.operation:
-                    case 'change_orbit':
-                        altitude, raan, inclination = event.parameters
-                        self._log_message(LOG_INFO,
-                                          f"получены новые параметры орбиты: altitude={altitude}, raan={raan}, inclination={inclination}")
-                        self._change_orbit(altitude, raan, inclination)
-                    case _:
-                        self._log_message(LOG_DEBUG, f"неизвестная операция: {event.operation}")
+                self._handle_event(event)
             except Empty:
                 break
 
@@ -66,6 +85,14 @@ class OrbitControl(BaseCustomProcess):
 
         while self._quit is False:
             try:
+                # Блокирующее ожидание события вместо цикла с get_nowait:
+                # процессор не нагружается, пока сообщений нет
+                try:
+                    event: Event = self._events_q.get(timeout=self._control_poll_interval)
+                    self._handle_event(event)
+                except Empty:
+                    pass
+
                 self._check_events_q()
                 self._check_control_q()
             except Exception as e:
@@ -73,7 +100,9 @@ class OrbitControl(BaseCustomProcess):
 
     def _change_orbit(self, altitude, raan, inclination):
         """Отправляет команду на изменение орбиты через монитор безопасности"""
-        q: Queue = self._queues_dir.get_queue(SECURITY_MONITOR_QUEUE_NAME)
+        q: Queue = self._security_monitor_q
+        if q is None:
+            q = self._security_monitor_q = self._queues_dir.get_queue(SECURITY_MONITOR_QUEUE_NAME)
         q.put(
             Event(
                 source=self._event_source_name,
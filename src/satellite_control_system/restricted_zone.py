@@ -1,25 +1,95 @@
-from dataclasses import dataclass
 from typing import Tuple, Optional
 import json
 
+import numpy as np
+
+try:
+    import orjson  # необязательная зависимость, ускоряет сериализацию
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit  # необязательная зависимость, ускоряет поиск по зонам
+except ImportError:
+    njit = None
+
+
+def _first_bbox_hit_py(lat, lon, bounds, n):
+    """Индекс первой из n зон, чей прямоугольник содержит точку, либо -1.
+
+    Долгота точки должна быть нормализована в [0, 360), как границы зон"""
+    for i in range(n):
+        if bounds[i, 0] <= lat <= bounds[i, 1] and \
+                bounds[i, 2] <= lon <= bounds[i, 3]:
+            return i
+    return -1
+
+
+# Скомпилированный вариант прохода по границам: без numba используется
+# векторный путь через query(), чистый питоновский цикл медленнее его
+_first_bbox_hit = njit(cache=True)(_first_bbox_hit_py) if njit is not None else None
+
 
-@dataclass
 class RestrictedZone:
     """ Описание зоны на карте, в которой запрещены снимки.
         Имеет прямоугольную форму и задается двумя точками на карте
 
         (lat_bot_left, lon_bot_left) и (lat_top_right, lon_top_right) """
-    lat_bot_left: float
-    lon_bot_left: float
-    lat_top_right: float
-    lon_top_right: float
-    zone_id: int
-    description: str = ""
-    severity_level: int = 1  # Уровень серьезности: 1-низкий, 2-средний, 3-высокий
+
+    # Уровень серьезности: 1-низкий, 2-средний, 3-высокий
+    __slots__ = (
+        'zone_id', 'lat_bot_left', 'lon_bot_left', 'lat_top_right', 'lon_top_right',
+        'description', 'severity_level', 'bbox',
+        '_lon_left_norm', '_lon_right_norm', '_wraps',
+        '_center', '_area', '_bounds',
+    )
 
     def __init__(self, zone_id, lat_bot_left, lon_bot_left, lat_top_right, lon_top_right,
                  description="", severity_level=1):
-        # Проверяем корректность координат
+        self._validate(lat_bot_left, lon_bot_left, lat_top_right, lon_top_right,
+                       severity_level)
+
+        self.zone_id = zone_id
+        self.lat_bot_left = lat_bot_left
+        self.lon_bot_left = lon_bot_left
+        self.lat_top_right = lat_top_right
+        self.lon_top_right = lon_top_right
+        self.description = description
+        self.severity_level = severity_level
+
+        # Нормализованные долготы считаем один раз, чтобы contains() и
+        # get_area() не повторяли модульную арифметику на каждом вызове
+        self._lon_left_norm = (lon_bot_left + 360) % 360
+        self._lon_right_norm = (lon_top_right + 360) % 360
+        self._wraps = self._lon_left_norm > self._lon_right_norm
+
+        # Ограничивающий прямоугольник (lat_min, lat_max, lon_min, lon_max)
+        # с долготами в нормализованном диапазоне [0, 360): сравнение с ним
+        # корректно и для зон в записи через линию перемены дат
+        # (например 170..-170); точка сравнения тоже должна быть нормализована
+        self.bbox = (lat_bot_left, lat_top_right,
+                     self._lon_left_norm, self._lon_right_norm)
+
+        # Зона после создания не меняется, поэтому производные величины
+        # считаем один раз, а не при каждом обращении
+        self._center = ((lat_bot_left + lat_top_right) / 2,
+                        (lon_bot_left + lon_top_right) / 2)
+        if not self._wraps:
+            lon_range = self._lon_right_norm - self._lon_left_norm
+        else:
+            lon_range = (360 - self._lon_left_norm) + self._lon_right_norm
+        self._area = abs(lat_top_right - lat_bot_left) * lon_range
+        self._bounds = {
+            'north': lat_top_right,
+            'south': lat_bot_left,
+            'west': lon_bot_left,
+            'east': lon_top_right
+        }
+
+    @staticmethod
+    def _validate(lat_bot_left, lon_bot_left, lat_top_right, lon_top_right,
+                  severity_level):
+        """Проверяет корректность параметров зоны"""
         if not (-90 <= lat_bot_left <= 90 and -90 <= lat_top_right <= 90):
             raise ValueError("Широта должна быть в диапазоне [-90, 90]")
         if not (-180 <= lon_bot_left <= 180 and -180 <= lon_top_right <= 180):
@@ -44,53 +114,50 @@ class RestrictedZone:
         if not (1 <= severity_level <= 3):
             raise ValueError("Уровень серьезности должен быть от 1 до 3")
 
-        self.zone_id = zone_id
-        self.lat_bot_left = lat_bot_left
-        self.lon_bot_left = lon_bot_left
-        self.lat_top_right = lat_top_right
-        self.lon_top_right = lon_top_right
-        self.description = description
-        self.severity_level = severity_level
-
     def contains(self, lat: float, lon: float) -> bool:
         """Проверяет, находится ли точка внутри запрещенной зоны"""
-        # Нормализуем долготы для корректной проверки
-        lat_in_range = self.lat_bot_left <= lat <= self.lat_top_right
+        # Сначала дешевый отсев по широте
+        bb = self.bbox
+        if not (bb[0] <= lat <= bb[1]):
+            return False
 
-        # Проверяем долготу с учетом возможного перехода через 180/-180
+        # Долгота сравнивается в нормализованном диапазоне [0, 360),
+        # в котором хранятся и границы bbox
         lon_normalized = (lon + 360) % 360
-        lon_left_normalized = (self.lon_bot_left + 360) % 360
-        lon_right_normalized = (self.lon_top_right + 360) % 360
 
-        if lon_left_normalized <= lon_right_normalized:
+        if not self._wraps:
             # Обычная зона без пересечения линии смены дат
-            lon_in_range = lon_left_normalized <= lon_normalized <= lon_right_normalized
+            return bb[2] <= lon_normalized <= bb[3]
+
+        # Зона пересекает линию смены дат
+        return (lon_normalized >= bb[2]) or (lon_normalized <= bb[3])
+
+    def contains_batch(self, lats, lons) -> np.ndarray:
+        """Векторная проверка набора точек на попадание в зону.
+
+        Принимает массивы широт и долгот одинаковой длины и возвращает
+        булев массив: True - точка внутри зоны. Все сравнения выполняются
+        в NumPy без цикла по точкам"""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+
+        lat_ok = (lats >= self.lat_bot_left) & (lats <= self.lat_top_right)
+
+        lon_norm = (lons + 360.0) % 360.0
+        if not self._wraps:
+            lon_ok = (lon_norm >= self._lon_left_norm) & (lon_norm <= self._lon_right_norm)
         else:
-            # Зона пересекает линию смены дат
-            lon_in_range = (lon_normalized >= lon_left_normalized) or (lon_normalized <= lon_right_normalized)
+            lon_ok = (lon_norm >= self._lon_left_norm) | (lon_norm <= self._lon_right_norm)
 
-        return lat_in_range and lon_in_range
+        return lat_ok & lon_ok
 
     def get_center(self) -> Tuple[float, float]:
         """Возвращает центр запрещенной зоны"""
-        center_lat = (self.lat_bot_left + self.lat_top_right) / 2
-        center_lon = (self.lon_bot_left + self.lon_top_right) / 2
-        return center_lat, center_lon
+        return self._center
 
     def get_area(self) -> float:
         """Возвращает площадь зоны в квадратных градусах"""
-        lat_range = abs(self.lat_top_right - self.lat_bot_left)
-
-        # Для долготы учитываем переход через 180/-180
-        lon_left_normalized = (self.lon_bot_left + 360) % 360
-        lon_right_normalized = (self.lon_top_right + 360) % 360
-
-        if lon_left_normalized <= lon_right_normalized:
-            lon_range = lon_right_normalized - lon_left_normalized
-        else:
-            lon_range = (360 - lon_left_normalized) + lon_right_normalized
-
-        return lat_range * lon_range
+        return self._area
 
     def get_severity_description(self) -> str:
         """Возвращает текстовое описание уровня серьезности"""
@@ -118,8 +185,19 @@ class RestrictedZone:
 
     def to_json(self) -> str:
         """Конвертирует зону в JSON строку"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
 
+    def to_json_bytes(self) -> bytes:
+        """Конвертирует зону в JSON в виде байтов.
+
+        Для передачи по каналам связи предпочтительнее to_json:
+        не тратится время на декодирование и обратное кодирование строки"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8")
+
     @classmethod
     def from_dict(cls, data: dict) -> 'RestrictedZone':
         """Создает зону из словаря"""
@@ -141,12 +219,7 @@ class RestrictedZone:
 
     def get_bounds(self) -> dict:
         """Возвращает границы зоны в удобном формате"""
-        return {
-            'north': self.lat_top_right,
-            'south': self.lat_bot_left,
-            'west': self.lon_bot_left,
-            'east': self.lon_top_right
-        }
+        return self._bounds
 
     def intersects(self, other: 'RestrictedZone') -> bool:
         """Проверяет, пересекается ли эта зона с другой зоной"""
@@ -170,4 +243,131 @@ class RestrictedZone:
                 f"desc='{self.description[:30]}...' if len(self.description) > 30 else self.description)")
 
     def __repr__(self) -> str:
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
+
+
+class RestrictedZoneIndex:
+    """ Индекс запретных зон для быстрого поиска по точке.
+
+        Границы зон хранятся в параллельных массивах NumPy (structure of
+        arrays), поэтому грубая проверка точки по всем зонам выполняется
+        одним векторным выражением, без цикла по объектам зон. Точная
+        проверка делается методом contains() только для кандидатов,
+        чей ограничивающий прямоугольник содержит точку """
+
+    # Начальная емкость массива границ
+    _INITIAL_CAPACITY = 8
+
+    def __init__(self):
+        self._zones = {}  # zone_id -> RestrictedZone
+        self._zone_ids = []  # порядок совпадает со строками массива границ
+        # Границы зон: lat_min, lat_max, lon_min, lon_max (долготы
+        # нормализованы в [0, 360), как в RestrictedZone.bbox). Массив
+        # выделен с запасом и растет удвоением: добавление и удаление зоны
+        # не копируют все строки, занято первых len(self._zone_ids) строк
+        self._bounds = np.empty((self._INITIAL_CAPACITY, 4), dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._zone_ids)
+
+    def __contains__(self, zone_id) -> bool:
+        return zone_id in self._zones
+
+    def get(self, zone_id) -> Optional[RestrictedZone]:
+        """Возвращает зону по идентификатору или None"""
+        return self._zones.get(zone_id)
+
+    def zones(self):
+        """Все зоны индекса"""
+        return self._zones.values()
+
+    def add(self, zone: RestrictedZone):
+        """Добавляет зону в индекс (повторное добавление заменяет старую)"""
+        if zone.zone_id in self._zones:
+            self.remove(zone.zone_id)
+
+        n = len(self._zone_ids)
+        if n == len(self._bounds):
+            grown = np.empty((n * 2, 4), dtype=np.float64)
+            grown[:n] = self._bounds
+            self._bounds = grown
+
+        self._bounds[n] = zone.bbox
+        self._zones[zone.zone_id] = zone
+        self._zone_ids.append(zone.zone_id)
+
+    def remove(self, zone_id) -> bool:
+        """Удаляет зону из индекса, возвращает False если такой зоны нет"""
+        if zone_id not in self._zones:
+            return False
+
+        idx = self._zone_ids.index(zone_id)
+        last = len(self._zone_ids) - 1
+        del self._zones[zone_id]
+
+        # Последняя строка переносится на место удаляемой: порядок зон
+        # в индексе не имеет значения, а сдвига всего массива не требуется
+        if idx != last:
+            self._zone_ids[idx] = self._zone_ids[last]
+            self._bounds[idx] = self._bounds[last]
+        self._zone_ids.pop()
+        return True
+
+    def query(self, lat: float, lon: float) -> list:
+        """Зоны-кандидаты, чей ограничивающий прямоугольник содержит точку"""
+        if not self._zone_ids:
+            return []
+
+        # Границы хранятся в нормализованных долготах, точку приводим к ним
+        lon = (lon + 360.0) % 360.0
+        b = self._bounds[:len(self._zone_ids)]
+        mask = (b[:, 0] <= lat) & (lat <= b[:, 1]) & \
+               (b[:, 2] <= lon) & (lon <= b[:, 3])
+        return [self._zones[self._zone_ids[i]] for i in np.flatnonzero(mask)]
+
+    def find_containing(self, lat: float, lon: float) -> Optional[RestrictedZone]:
+        """Первая зона, в которую попадает точка, или None"""
+        if _first_bbox_hit is not None:
+            n = len(self._zone_ids)
+            if n == 0:
+                return None
+            i = int(_first_bbox_hit(lat, (lon + 360.0) % 360.0, self._bounds, n))
+            if i < 0:
+                return None
+            zone = self._zones[self._zone_ids[i]]
+            if zone.contains(lat, lon):
+                return zone
+            # Точная проверка первого кандидата не прошла:
+            # достаем остальных кандидатов общим путем
+
+        for zone in self.query(lat, lon):
+            if zone.contains(lat, lon):
+                return zone
+        return None
+
+    def find_containing_batch(self, lats, lons) -> list:
+        """Для каждой точки набора - первая содержащая ее зона или None.
+
+        Грубая проверка всех точек против всех зон выполняется одним
+        векторным выражением над маской (точки x зоны); точная проверка
+        contains() вызывается только для непустых ячеек маски"""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+
+        result = [None] * len(lats)
+        if not self._zone_ids:
+            return result
+
+        # Границы хранятся в нормализованных долготах, точки приводим к ним
+        lons_norm = (lons + 360.0) % 360.0
+        b = self._bounds[:len(self._zone_ids)]
+        mask = (b[:, 0] <= lats[:, None]) & (lats[:, None] <= b[:, 1]) & \
+               (b[:, 2] <= lons_norm[:, None]) & (lons_norm[:, None] <= b[:, 3])
+
+        for i in np.flatnonzero(mask.any(axis=1)):
+            for j in np.flatnonzero(mask[i]):
+                zone = self._zones[self._zone_ids[j]]
+                if zone.contains(lats[i], lons[i]):
+                    result[i] = zone
+                    break
+        return result
\ No newline at end of file
@@ -1,16 +1,25 @@
 # Новый файл: src/satellite_control_system/security_monitor.py
 """Монитор безопасности с проверкой запретных зон"""
+from array import array
+from dataclasses import replace
 from multiprocessing import Queue
-from time import sleep
 from queue import Empty
 
+import numpy as np
+
 from src.system.custom_process import BaseCustomProcess
 from src.system.queues_dir import QueuesDirectory
 from src.system.event_types import Event, ControlEvent
 from src.system.config import LOG_ERROR, LOG_DEBUG, LOG_INFO, DEFAULT_LOG_LEVEL, \
-    SECURITY_MONITOR_QUEUE_NAME, ORBIT_DRAWER_QUEUE_NAME, OPTICS_CONTROL_QUEUE_NAME
+    SECURITY_MONITOR_QUEUE_NAME, ORBIT_DRAWER_QUEUE_NAME, OPTICS_CONTROL_QUEUE_NAME, \
+    CONTROL_POLL_INTERVAL_SEC
 from src.system.security_policy_type import SecurityPolicy
-from src.satellite_control_system.restricted_zone import RestrictedZone
+from src.satellite_control_system.restricted_zone import RestrictedZone, \
+    RestrictedZoneIndex
+
+# Операции снимков, проверяемые по запретным зонам: проверка принадлежности
+# множеству вместо цепочки сравнений строк
+_PHOTO_OPS = frozenset({'update_photo_map'})
 
 
 class SecurityMonitor(BaseCustomProcess):
@@ -20,7 +29,14 @@ class SecurityMonitor(BaseCustomProcess):
     event_source_name = SECURITY_MONITOR_QUEUE_NAME
     events_q_name = event_source_name
 
-    def __init__(self, queues_dir: QueuesDirectory, log_level: int = DEFAULT_LOG_LEVEL):
+    # Максимальный размер пачки снимков, проверяемых одним вычислением
+    _PHOTO_BATCH_MAX = 64
+
+    # Размер пачки событий отрисовщику, отправляемой одним сообщением
+    _DRAWER_FLUSH_SIZE = 32
+
+    def __init__(self, queues_dir: QueuesDirectory, log_level: int = DEFAULT_LOG_LEVEL,
+                 recalc_interval_sec: float = CONTROL_POLL_INTERVAL_SEC):
         super().__init__(
             log_prefix=self.log_prefix,
             queues_dir=queues_dir,
@@ -34,91 +50,246 @@ class SecurityMonitor(BaseCustomProcess):
             SecurityPolicy(source="*", destination="*", operation="*"),
         ]
 
-        # Запретные зоны
-        self._restricted_zones = {}
+        # Запретные зоны: индекс с грубой проверкой по ограничивающим
+        # прямоугольникам, точная проверка только для кандидатов
+        self._restricted_zones = RestrictedZoneIndex()
 
-        # Счетчик нарушений
-        self._violations = {}
+        # Счетчики нарушений: имя пользователя один раз получает индекс,
+        # сами счетчики лежат в непрерывном массиве int64 вместо словаря
+        # разрозненных питоновских чисел
+        self._user_ids = {}
+        self._viol_counts = array('q')
+
+        # Буфер событий снимков: проверяются пачкой одним векторным
+        # вычислением вместо поштучного обхода зон
+        self._photo_batch = []
 
         # Интервал обновления
-        self._recalc_interval_sec = 0.1
+        self._recalc_interval_sec = recalc_interval_sec
+
+        # Очередь отрисовщика ищется в каталоге один раз
+        self._drawer_q = None
+
+        # Буфер исходящих событий отрисовщику: пачка уходит одним put()
+        self._drawer_outbox = []
+
+        # Заготовки событий отрисовщику: постоянные поля заполняются один
+        # раз, на каждое событие подставляются только параметры
+        self._tmpl_draw_zone = Event(
+            source=self._event_source_name,
+            destination=ORBIT_DRAWER_QUEUE_NAME,
+            operation='draw_restricted_zone',
+            parameters=None)
+        self._tmpl_clear_zone = replace(
+            self._tmpl_draw_zone, operation='clear_restricted_zone')
+
+        # Таблица обработчиков операций: поиск за O(1) вместо цепочки
+        # сравнений; прочие операции пересылаются получателю
+        self._op_table = {
+            'add_restricted_zone': self._handle_add_zone,
+            'remove_restricted_zone': self._handle_remove_zone,
+        }
 
         self._log_message(LOG_INFO, "Монитор безопасности создан")
 
     def _check_event(self, event: Event) -> bool:
         """Проверка события на соответствие политикам безопасности"""
         # Проверяем только операции съемки на наличие в запретных зонах
-        if event.destination == ORBIT_DRAWER_QUEUE_NAME and event.operation == 'update_photo_map':
-            if event.parameters and isinstance(event.parameters, (tuple, list)) and len(event.parameters) >= 2:
+        if event.destination == ORBIT_DRAWER_QUEUE_NAME and event.operation in _PHOTO_OPS:
+            # Утиный разбор координат: в типичном случае это два
+            # индексирования, некорректные параметры отсеиваются исключением
+            try:
                 lat, lon = event.parameters[0], event.parameters[1]
+            except (TypeError, IndexError, KeyError):
+                return True
 
-                for zone in self._restricted_zones.values():
-                    if zone.contains(lat, lon):
-                        user = event.extra_parameters.get('user', 'unknown') if event.extra_parameters else 'unknown'
-                        self._log_message(LOG_ERROR,
-                                          f"НАРУШЕНИЕ: Пользователь {user} сделал снимок в запретной зоне {zone.zone_id}")
-                        return False
+            zone = self._restricted_zones.find_containing(lat, lon)
+            if zone is not None:
+                user = event.extra_parameters.get('user', 'unknown') if event.extra_parameters else 'unknown'
+                self._count_violation(user)
+                self._log_message(LOG_ERROR,
+                                  "НАРУШЕНИЕ: Пользователь %s сделал снимок в запретной зоне %s", user, zone.zone_id)
+                return False
 
         return True
 
+    def _drawer(self) -> Queue:
+        """Очередь отрисовщика (находится в каталоге при первом обращении)"""
+        if self._drawer_q is None:
+            self._drawer_q = self._queues_dir.get_queue(ORBIT_DRAWER_QUEUE_NAME)
+        return self._drawer_q
+
+    def _send_to_drawer(self, event: Event):
+        """Ставит событие в буфер отрисовщика"""
+        self._drawer_outbox.append(event)
+        if len(self._drawer_outbox) >= self._DRAWER_FLUSH_SIZE:
+            self._flush_drawer()
+
+    def _flush_drawer(self):
+        """Отправляет накопленные события отрисовщику одним сообщением"""
+        events = self._drawer_outbox
+        if not events:
+            return
+        self._drawer_outbox = []
+
+        q = self._drawer()
+        if q is None:
+            self._log_message(LOG_ERROR, "Получатель не найден: %s", ORBIT_DRAWER_QUEUE_NAME)
+            return
+
+        # Очереди с пакетным интерфейсом (faster_fifo.Queue) кладут всю
+        # пачку за один захват блокировки
+        put_many = getattr(q, 'put_many', None)
+        if put_many is not None:
+            put_many(events)
+        elif len(events) == 1:
+            # Одиночное событие отправляем как есть, без обертки в список
+            q.put(events[0])
+        else:
+            q.put(events)
+
     def _proceed(self, event: Event):
         """Обработка разрешенного события"""
-        # Обработка команд управления зонами
-        if event.operation == 'add_restricted_zone':
-            zone = event.parameters
-            if isinstance(zone, RestrictedZone):
-                self._restricted_zones[zone.zone_id] = zone
-                self._log_message(LOG_INFO, f"Добавлена запретная зона {zone.zone_id}")
-
-                # Отправка зоны в отрисовщик
-                q: Queue = self._queues_dir.get_queue(ORBIT_DRAWER_QUEUE_NAME)
-                if q:
-                    q.put(Event(
-                        source=self._event_source_name,
-                        destination=ORBIT_DRAWER_QUEUE_NAME,
-                        operation='draw_restricted_zone',
-                        parameters=zone
-                    ))
-
-        elif event.operation == 'remove_restricted_zone':
-            zone_id = event.parameters
-            if zone_id in self._restricted_zones:
-                del self._restricted_zones[zone_id]
-                self._log_message(LOG_INFO, f"Удалена запретная зона {zone_id}")
-
-                # Удаление зоны из отрисовщика
-                q: Queue = self._queues_dir.get_queue(ORBIT_DRAWER_QUEUE_NAME)
-                if q:
-                    q.put(Event(
-                        source=self._event_source_name,
-                        destination=ORBIT_DRAWER_QUEUE_NAME,
-                        operation='clear_restricted_zone',
-                        parameters=zone_id
-                    ))
+        handler = self._op_table.get(event.operation)
+        if handler is not None:
+            handler(event)
+        else:
+            self._forward_event(event)
+
+    def _handle_add_zone(self, event: Event):
+        """Добавление запретной зоны"""
+        zone = event.parameters
+        if not isinstance(zone, RestrictedZone):
+            return
+
+        self._restricted_zones.add(zone)
+        self._log_message(LOG_INFO, "Добавлена запретная зона %s", zone.zone_id)
 
+        # Отправка зоны в отрисовщик
+        self._send_to_drawer(replace(self._tmpl_draw_zone, parameters=zone))
+
+    def _handle_remove_zone(self, event: Event):
+        """Удаление запретной зоны"""
+        zone_id = event.parameters
+        if not self._restricted_zones.remove(zone_id):
+            return
+
+        self._log_message(LOG_INFO, "Удалена запретная зона %s", zone_id)
+
+        # Удаление зоны из отрисовщика
+        self._send_to_drawer(replace(self._tmpl_clear_zone, parameters=zone_id))
+
+    def _forward_event(self, event: Event):
+        """Пересылка проверенного события конечному получателю"""
+        # События отрисовщику идут через буфер и уходят пачками
+        if event.destination == ORBIT_DRAWER_QUEUE_NAME:
+            self._send_to_drawer(event)
+            return
+
+        destination_q = self._queues_dir.get_queue(event.destination)
+        if destination_q is None:
+            self._log_message(LOG_ERROR, "Получатель не найден: %s", event.destination)
         else:
-            # Стандартная обработка
-            destination_q = self._queues_dir.get_queue(event.destination)
-            if destination_q is None:
-                self._log_message(LOG_ERROR, f"Получатель не найден: {event.destination}")
+            destination_q.put(event)
+            self._log_message(LOG_DEBUG, "Событие отправлено: %s", event.operation)
+
+    def _is_photo_check(self, event: Event) -> bool:
+        """Событие снимка, подлежащее пакетной проверке запретных зон"""
+        if event.destination != ORBIT_DRAWER_QUEUE_NAME \
+                or event.operation not in _PHOTO_OPS:
+            return False
+        try:
+            event.parameters[0]
+            event.parameters[1]
+        except (TypeError, IndexError, KeyError):
+            return False
+        return True
+
+    def _handle_event(self, event: Event):
+        """Обработка одного входящего события"""
+        # Пачка событий, отправленная одним сообщением очереди
+        if isinstance(event, list):
+            for item in event:
+                self._handle_event(item)
+            return
+
+        if not isinstance(event, Event):
+            return
+
+        self._log_message(LOG_DEBUG, "Получено событие: %s", event.operation)
+
+        # Снимки копятся в буфере и проверяются одной векторной операцией
+        if self._is_photo_check(event):
+            self._photo_batch.append(event)
+            if len(self._photo_batch) >= self._PHOTO_BATCH_MAX:
+                self._flush_photo_batch()
+            return
+
+        # Остальные события могут менять набор зон: сначала проверяем
+        # накопленные снимки, чтобы сохранить исходный порядок событий
+        self._flush_photo_batch()
+
+        if self._check_event(event):
+            self._proceed(event)
+
+        self._ack_event(event)
+
+    def _flush_photo_batch(self):
+        """Проверяет накопленные снимки по зонам и рассылает разрешенные"""
+        batch = self._photo_batch
+        if not batch:
+            return
+        self._photo_batch = []
+
+        if len(batch) == 1:
+            # Одиночный снимок дешевле проверить без сборки массивов
+            event = batch[0]
+            if self._check_event(event):
+                self._proceed(event)
+            self._ack_event(event)
+            return
+
+        n = len(batch)
+        lats = np.fromiter((e.parameters[0] for e in batch), dtype=np.float64, count=n)
+        lons = np.fromiter((e.parameters[1] for e in batch), dtype=np.float64, count=n)
+        zones = self._restricted_zones.find_containing_batch(lats, lons)
+
+        for event, zone in zip(batch, zones):
+            if zone is None:
+                self._proceed(event)
             else:
-                destination_q.put(event)
-                self._log_message(LOG_DEBUG, f"Событие отправлено: {event.operation}")
+                user = event.extra_parameters.get('user', 'unknown') if event.extra_parameters else 'unknown'
+                self._count_violation(user)
+                self._log_message(LOG_ERROR,
+                                  "НАРУШЕНИЕ: Пользователь %s сделал снимок в запретной зоне %s", user, zone.zone_id)
+            self._ack_event(event)
+
+    def _ack_event(self, event: Event):
+        """Подтверждение обработки события отправителю, если он его запросил"""
+        ep = event.extra_parameters
+        if not isinstance(ep, dict):
+            return
+
+        ack_to = ep.get('ack_to')
+        if not ack_to:
+            return
+
+        q: Queue = self._queues_dir.get_queue(ack_to)
+        if q:
+            q.put(Event(
+                source=self._event_source_name,
+                destination=ack_to,
+                operation='ack',
+                parameters=event.operation,
+                signature=event.signature
+            ))
 
     def _check_events_q(self):
         """Проверка входящих событий"""
         while True:
             try:
                 event: Event = self._events_q.get_nowait()
-
-                if not isinstance(event, Event):
-                    continue
-
-                self._log_message(LOG_DEBUG, f"Получено событие: {event.operation}")
-
-                if self._check_event(event):
-                    self._proceed(event)
-
+                self._handle_event(event)
             except Empty:
                 break
 
@@ -127,9 +298,34 @@ class SecurityMonitor(BaseCustomProcess):
         self._log_message(LOG_INFO, "Монитор безопасности запущен")
 
         while not self._quit:
+            # Блокирующее ожидание вместо фиксированной паузы: просыпаемся
+            # сразу при поступлении события, а не через каждый интервал
+            try:
+                event: Event = self._events_q.get(timeout=self._recalc_interval_sec)
+                self._handle_event(event)
+            except Empty:
+                pass
+
             self._check_events_q()
+            # Очередь опустела: проверяем снимки и отправляем накопленное
+            # отрисовщику, не дожидаясь полных пачек
+            self._flush_photo_batch()
+            self._flush_drawer()
             self._check_control_q()
-            sleep(self._recalc_interval_sec)
+
+    def _count_violation(self, user: str):
+        """Увеличивает счетчик нарушений пользователя"""
+        idx = self._user_ids.get(user)
+        if idx is None:
+            idx = len(self._viol_counts)
+            self._user_ids[user] = idx
+            self._viol_counts.append(0)
+        self._viol_counts[idx] += 1
+
+    def get_violation_stats(self) -> dict:
+        """Количество нарушений по пользователям (копия счетчиков)"""
+        counts = self._viol_counts
+        return {user: counts[idx] for user, idx in self._user_ids.items()}
 
     def stop(self):
         """Остановка монитора"""
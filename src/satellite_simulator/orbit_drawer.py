@@ -30,14 +30,19 @@ class OrbitDrawer(BaseCustomProcess):
     def __init__(
         self,
         queues_dir : QueuesDirectory,
-        log_level : int = DEFAULT_LOG_LEVEL
+        log_level : int = DEFAULT_LOG_LEVEL,
+        events_q : Queue = None
     ):
+        # events_q позволяет подставить более быструю реализацию очереди
+        # с тем же интерфейсом (например, faster_fifo.Queue) для потока
+        # событий отрисовки
         super().__init__(
             log_prefix=OrbitDrawer.log_prefix,
             queues_dir=queues_dir,
             events_q_name=OrbitDrawer.events_q_name,
             event_source_name=OrbitDrawer.event_source_name,
-            log_level=log_level)
+            log_level=log_level,
+            events_q=events_q)
         
         # Set up figure
         self._num_frames = 50
@@ -65,28 +70,36 @@ class OrbitDrawer(BaseCustomProcess):
         self._log_message(LOG_INFO, f"отрисовщик создан")
 
 
+    def _handle_event(self, event: Event):
+        """ Обработка одного входящего события """
+        # Пачка событий, отправленная одним сообщением очереди
+        if isinstance(event, list):
+            for item in event:
+                self._handle_event(item)
+            return
+
+        if not isinstance(event, Event):
+            return
+
+        match(event.operation):
+            case 'update_orbit_data':
+                lat, lon = event.parameters
+                self._append_positions(lat, lon)
+            case 'update_photo_map':
+                lat, lon = event.parameters
+                self._append_photos(lat, lon)
+            case 'draw_restricted_zone':
+                zone : RestrictedZone = event.parameters
+                self._append_restricted_zones(zone)
+            case 'clear_restricted_zone':
+                zone_id : int = event.parameters
+                self._remove_restricted_zone(zone_id)
+
     def _check_events_q(self):
         while True:
             try:
                 event: Event = self._events_q.get_nowait()
-
-                if not isinstance(event, Event):
-                    return
-                
-                match(event.operation):
-                    case 'update_orbit_data':
-                        lat, lon = event.parameters
-                        self._append_positions(lat, lon)
-                    case 'update_photo_map':
-                        lat, lon = event.parameters
-                        self._append_photos(lat, lon)
-                    case 'draw_restricted_zone':
-                        zone : RestrictedZone = event.parameters
-                        self._append_restricted_zones(zone)
-                    case 'clear_restricted_zone':
-                        zone_id : int = event.parameters
-                        self._remove_restricted_zone(zone_id)
-
+                self._handle_event(event)
             except Empty:
                 break
 
@@ -31,7 +31,8 @@ class Satellite(BaseCustomProcess):
         inclination: float,
         raan: float,
         queues_dir: QueuesDirectory,
-        log_level: int = DEFAULT_LOG_LEVEL
+        log_level: int = DEFAULT_LOG_LEVEL,
+        recalc_interval_sec: float = 0.1
     ):
         super().__init__(
             log_prefix=Satellite.log_prefix,
@@ -60,7 +61,7 @@ class Satellite(BaseCustomProcess):
             self._position_angle, 
             self._inclination)
         
-        self._recalc_interval_sec = 0.1 # Время пересчета координат (сек.)
+        self._recalc_interval_sec = recalc_interval_sec # Время пересчета координат (сек.)
         self._time_speed_sec = 30 # Время пересчета координат (сек.), время прошедшее для спутника
         self._log_message(LOG_INFO, f"симулятор создан")
 
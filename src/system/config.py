@@ -6,6 +6,10 @@ CAMERA_QUEUE_NAME = "camera"
 SECURITY_MONITOR_QUEUE_NAME = "security"
 DATABASE_QUEUE_NAME = "database"
 DISPATCHER_QUEUE_NAME = "dispatcher"
+CLIENT_QUEUE_NAME = "client"
+
+ACK_TIMEOUT_SEC = 5.0  # максимальное время ожидания подтверждения команды (сек)
+CONTROL_POLL_INTERVAL_SEC = 0.1  # период опроса управляющих команд (сек)
 
 DEFAULT_LOG_LEVEL = 2  # 1 - errors, 2 - verbose, 3 - debug
 LOG_FAILURE = 0
@@ -14,11 +14,15 @@ class BaseCustomProcess(Process):
         events_q_name: str,
         event_source_name: str,
         log_level: int = DEFAULT_LOG_LEVEL,
+        events_q: Queue = None,
     ):
         super().__init__()
 
         self._queues_dir = queues_dir
-        self._events_q = Queue()
+        # Очередь событий можно передать извне, чтобы подставить более
+        # быструю реализацию с тем же интерфейсом put/get
+        # (например, faster_fifo.Queue); по умолчанию - стандартная
+        self._events_q = events_q if events_q is not None else Queue()
         self._events_q_name = events_q_name
         self._event_source_name = event_source_name
         self.log_prefix = log_prefix
@@ -29,14 +33,19 @@ class BaseCustomProcess(Process):
 
         self._quit = False
     
-    def _log_message(self, criticality: int, message: str):
+    def _log_message(self, criticality: int, message: str, *args):
         """_log_message печатает сообщение заданного уровня критичности
 
         Args:
             criticality (int): уровень критичности
-            message (str): текст сообщения
+            message (str): текст сообщения или %-шаблон
+            *args: аргументы %-шаблона; подставляются только если сообщение
+                проходит по уровню, что избавляет горячие пути от
+                форматирования отключенных сообщений
         """
         if criticality <= self.log_level:
+            if args:
+                message = message % args
             print(f"[{CRITICALITY_STR[criticality]}]{self.log_prefix} {message}")
     
 
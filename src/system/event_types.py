@@ -4,7 +4,9 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass
+# slots=True: события создаются на каждое сообщение, отказ от __dict__
+# уменьшает объем экземпляра и ускоряет доступ к полям
+@dataclass(slots=True)
 class Event:
     """формат событий для обработки"""
 
@@ -18,7 +20,7 @@ class Event:
     # для проверки целостности и аутентичности сообщения
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlEvent:
     """формат управляющих команд для сущностей (например, для остановки работы)"""
 
@@ -3,12 +3,10 @@ from abc import abstractmethod
 from multiprocessing import Queue, Process
 from queue import Empty
 
-from time import sleep
-
 from src.system.custom_process import BaseCustomProcess
 from src.system.config import LOG_ERROR, SECURITY_MONITOR_QUEUE_NAME,\
     CRITICALITY_STR, DEFAULT_LOG_LEVEL, \
-    LOG_DEBUG, LOG_INFO
+    LOG_DEBUG, LOG_INFO, CONTROL_POLL_INTERVAL_SEC
 from src.system.queues_dir import QueuesDirectory
 from src.system.event_types import Event, ControlEvent
 
@@ -19,7 +17,8 @@ class BaseSecurityMonitor(BaseCustomProcess):
     event_source_name = SECURITY_MONITOR_QUEUE_NAME
     events_q_name = event_source_name
 
-    def __init__(self, queues_dir: QueuesDirectory, log_level: int):
+    def __init__(self, queues_dir: QueuesDirectory, log_level: int,
+                 recalc_interval_sec: float = CONTROL_POLL_INTERVAL_SEC):
         # вызываем конструктор базового класса
         super().__init__(
             log_prefix=BaseSecurityMonitor.log_prefix,
@@ -29,10 +28,22 @@ class BaseSecurityMonitor(BaseCustomProcess):
             log_level=log_level)
 
         # инициализируем интервал обновления
-        self._recalc_interval_sec = 0.1
+        self._recalc_interval_sec = recalc_interval_sec
         self._log_message(LOG_INFO, "создан монитор безопасности")
 
 
+    def _handle_event(self, event: Event):
+        """_handle_event обработка одного входящего сообщения"""
+
+        if not isinstance(event, Event):
+            # событие неправильного типа, пропускаем
+            return
+
+        self._log_message(LOG_DEBUG, f"получен запрос {event}")
+
+        if self._check_event(event):
+            self._proceed(event)
+
     def _check_events_q(self):
         """_check_events_q в цикле проверим все входящие сообщения,
         выход из цикла по условию отсутствия новых сообщений
@@ -45,15 +56,8 @@ class BaseSecurityMonitor(BaseCustomProcess):
                 # в очереди не команд на обработку,
                 # выходим из цикла проверки
                 break
-            if not isinstance(event, Event):
-                # событие неправильного типа, пропускаем
-                continue
+            self._handle_event(event)
 
-            self._log_message(LOG_DEBUG, f"получен запрос {event}")
-
-            if self._check_event(event):
-                self._proceed(event)
-                
 
     @abstractmethod
     def _check_event(self, event: Event):
@@ -75,6 +79,13 @@ class BaseSecurityMonitor(BaseCustomProcess):
         self._log_message(LOG_INFO, "старт монитора безопасности")
 
         while self._quit is False:
-            sleep(self._recalc_interval_sec)
+            # ждем первое событие блокирующим вызовом вместо фиксированной
+            # паузы: обработка начинается сразу при поступлении сообщения
+            try:
+                event: Event = self._events_q.get(timeout=self._recalc_interval_sec)
+                self._handle_event(event)
+            except Empty:
+                pass
+
             self._check_events_q()
             self._check_control_q()